@@ -16,3 +16,4 @@ class Config:
         self.timezone = pytz.timezone(os.getenv("TIMEZONE", "Europe/Moscow"))
         self.mode = os.getenv("MODE", "regular")
         self.cache_file = "data_cache.json"
+        self.registry_file = "processed_registry.json"
@@ -13,6 +13,8 @@ from src.telegram.client import get_channel_stats, get_chat_stats, get_channel_n
 from src.sheets.client import SheetStorage
 from src.sheets.config import SHEET_CONFIGS
 from src.cache import load_cache, save_cache, datetime_handler
+from src.registry import load_registry, save_registry
+from src.sketch import HyperLogLog
 from src.telegram.utils import mask_channel_link
 
 ROOT_DIR = Path(__file__).parent.parent
@@ -76,6 +78,7 @@ async def print_welcome_msg(config):
 async def main():
     config = Config()
     cache_path = os.path.join(ROOT_DIR, config.cache_file)
+    registry_path = os.path.join(ROOT_DIR, config.registry_file)
     PROCESSED_AT = datetime.now(config.timezone)
 
     await print_welcome_msg(config)
@@ -86,6 +89,7 @@ async def main():
         all_stats = cached_data
     else:
         logger.info("Collecting fresh data")
+        registry = load_registry(registry_path)
         async with TelegramClient(
             StringSession(os.getenv("TG_SESSION")), config.api_id, config.api_hash
         ) as client:
@@ -106,7 +110,9 @@ async def main():
 
             for channel_id in channel_progress:
                 await asyncio.sleep(5)
-                stats = await get_channel_stats(client, channel_id, config.timezone)
+                stats = await get_channel_stats(
+                    client, channel_id, config.timezone, registry
+                )
                 if stats:
                     channel_progress.set_description(stats["channel_name"])
                     all_stats["channels"].append(stats)
@@ -128,6 +134,7 @@ async def main():
 
             logger.info("Data collection completed!\n")
             save_cache(all_stats, cache_path)
+            save_registry(registry, registry_path)
 
     storage = SheetStorage(config.credentials_path, config.sheet_url)
 
@@ -137,7 +144,7 @@ async def main():
             "channel_name": c["channel_name"],
             "date": PROCESSED_AT.date(),
             "member_count": c["member_count"],
-            "messages_count": len(c["messages"]),
+            "messages_count": c.get("message_count", len(c["messages"])),
             "processed_at": PROCESSED_AT,
         }
         for c in all_stats["channels"]
@@ -147,6 +154,13 @@ async def main():
         "channels_daily", channels_daily, SHEET_CONFIGS["channels_daily"]
     )
 
+    # Edited messages replace all rows previously exported for them
+    replaced_messages = [
+        {"channel_id": channel["channel_id"], "message_id": msg["message_id"]}
+        for channel in all_stats["channels"]
+        for msg in channel["messages"]
+    ]
+
     hashtags_data = []
     for channel in all_stats["channels"]:
         for occurrence in channel["hashtag_occurrences"]:
@@ -161,10 +175,12 @@ async def main():
                 }
             )
 
-    if hashtags_data:
-        storage.merge_data(
-            "hashtags_detailed", hashtags_data, SHEET_CONFIGS["hashtags_detailed"]
-        )
+    storage.merge_data(
+        "hashtags_detailed",
+        hashtags_data,
+        SHEET_CONFIGS["hashtags_detailed"],
+        replace_keys=replaced_messages,
+    )
 
     messages = []
     for channel in all_stats["channels"]:
@@ -183,15 +199,24 @@ async def main():
                         }
                     )
 
-    storage.merge_data("channel_messages", messages, SHEET_CONFIGS["channel_messages"])
+    storage.merge_data(
+        "channel_messages",
+        messages,
+        SHEET_CONFIGS["channel_messages"],
+        replace_keys=replaced_messages,
+    )
 
     chat_topics = []
+    chats_daily = {}
     for chat in all_stats["chats"]:
         for topic_id, topic_data in chat["topics"].items():
             for hour_str, message_data in topic_data["messages"].items():
                 parsed_hour = datetime.fromisoformat(hour_str).strftime(
                     "%Y-%m-%dT%H:%M:%S"
                 )
+                # Caches written before sketches were collected have none
+                sketch = message_data.get("senders_sketch")
+                senders = HyperLogLog.from_string(sketch) if sketch else HyperLogLog()
                 chat_topics.append(
                     {
                         "chat_id": chat["chat_id"],
@@ -202,14 +227,45 @@ async def main():
                         "message_count": message_data["count"],
                         "first_message_id": message_data["first_id"],
                         "last_message_id": message_data["last_id"],
+                        "distinct_senders": senders.count() if sketch else "",
                         "processed_at": PROCESSED_AT,
                     }
                 )
 
+                # Merge hourly sketches of all topics into one per chat and day
+                day = datetime.fromisoformat(hour_str).date()
+                key = (chat["chat_id"], day)
+                if key not in chats_daily:
+                    chats_daily[key] = {
+                        "chat_id": chat["chat_id"],
+                        "chat_name": chat["chat_name"],
+                        "date": day,
+                        "message_count": 0,
+                        "senders": HyperLogLog(),
+                        "has_sketch": True,
+                    }
+                chats_daily[key]["message_count"] += message_data["count"]
+                chats_daily[key]["senders"].merge(senders)
+                chats_daily[key]["has_sketch"] &= bool(sketch)
+
     storage.merge_data(
         "chat_topics_hourly", chat_topics, SHEET_CONFIGS["chat_topics_hourly"]
     )
 
+    chats_daily_data = [
+        {
+            "chat_id": d["chat_id"],
+            "chat_name": d["chat_name"],
+            "date": d["date"],
+            "message_count": d["message_count"],
+            "distinct_senders": d["senders"].count() if d["has_sketch"] else "",
+            "processed_at": PROCESSED_AT,
+        }
+        for d in chats_daily.values()
+    ]
+
+    storage.merge_data("chats_daily", chats_daily_data, SHEET_CONFIGS["chats_daily"])
+
     if os.path.exists(cache_path):
         os.remove(cache_path)
         logger.info("Cache cleared")
@@ -0,0 +1,43 @@
+import hashlib
+from src.cache import load_cache, save_cache
+
+
+def load_registry(filename):
+    """Load the processed-message registry, or an empty one on the first run"""
+    return load_cache(filename) or {"channels": {}}
+
+
+def save_registry(registry, filename):
+    save_cache(registry, filename)
+
+
+def get_channel_registry(registry, channel_id):
+    return registry["channels"].setdefault(
+        channel_id, {"max_id": 0, "message_count": 0, "messages": {}}
+    )
+
+
+def message_fingerprint(message):
+    """Edit date and content hash identifying one version of a message"""
+    edit_date = message.edit_date.isoformat() if message.edit_date else None
+    text_hash = hashlib.sha1(message.text.encode("utf-8")).hexdigest()
+    return {"edit_date": edit_date, "hash": text_hash}
+
+
+def is_processed(channel_registry, message, fingerprint):
+    return channel_registry["messages"].get(str(message.id)) == fingerprint
+
+
+def mark_processed(channel_registry, processed, keep):
+    """Register a completed pass, keeping fingerprints of the newest messages only"""
+    previous_max_id = channel_registry["max_id"]
+    for message, fingerprint in processed:
+        channel_registry["messages"][str(message.id)] = fingerprint
+        if message.id > previous_max_id:
+            channel_registry["message_count"] += 1
+        channel_registry["max_id"] = max(channel_registry["max_id"], message.id)
+
+    newest = sorted(channel_registry["messages"], key=int, reverse=True)[:keep]
+    channel_registry["messages"] = {
+        message_id: channel_registry["messages"][message_id] for message_id in newest
+    }
@@ -34,7 +34,7 @@ class SheetStorage:
                 df[col] = pd.to_datetime(df[col]).dt.strftime("%Y-%m-%d %H:%M:%S")
         return df
 
-    def merge_data(self, sheet_name, new_data, config):
+    def merge_data(self, sheet_name, new_data, config, replace_keys=None):
         self.logger.info(f"Starting merge for sheet: '{sheet_name}' ...")
         sheet = self._get_or_create_sheet(sheet_name)
 
@@ -42,7 +42,7 @@ class SheetStorage:
         new_df = pd.DataFrame(new_data)
 
         # Handle empty DataFrame case
-        if new_df.empty:
+        if new_df.empty and not replace_keys:
             self.logger.warning(f"No data to update in sheet '{sheet_name}'")
             return
 
@@ -64,6 +64,14 @@ class SheetStorage:
             if not existing_data.empty:
                 # Convert dates in existing data
                 existing_data = self._convert_dates_to_strings(existing_data)
+                # Drop every row of re-processed items so stale rows do not survive
+                if replace_keys:
+                    replace_df = pd.DataFrame(replace_keys)
+                    columns = replace_df.columns.tolist()
+                    replaced = existing_data.set_index(columns).index.isin(
+                        replace_df.set_index(columns).index
+                    )
+                    existing_data = existing_data[~replaced]
                 # Merge with deduplication
                 merged = pd.concat([existing_data, new_df]).drop_duplicates(
                     subset=config["key_columns"], keep="last"
@@ -71,6 +79,13 @@ class SheetStorage:
             else:
                 merged = new_df
 
+        if merged.columns.empty:
+            self.logger.warning(f"No data to update in sheet '{sheet_name}'")
+            return
+
+        # Rows written before a column was added have no value for it
+        merged = merged.fillna("")
+
         # Update sheet
         sheet.clear()
         # Convert to nested list and ensure all values are strings
@@ -17,8 +17,14 @@ SHEET_CONFIGS = {
             "message_count",
             "first_message_id",
             "last_message_id",
+            "distinct_senders",
         ],
         "timestamp_column": "processed_at",
     },
+    "chats_daily": {
+        "key_columns": ["chat_id", "date"],
+        "merge_columns": ["chat_name", "message_count", "distinct_senders"],
+        "timestamp_column": "processed_at",
+    },
     "hashtags_detailed": {"key_columns": ["channel_id", "message_id", "hashtag"]},
 }
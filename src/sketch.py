@@ -0,0 +1,70 @@
+import base64
+import hashlib
+import math
+
+DEFAULT_PRECISION = 10  # 1024 registers, ~3% standard error
+
+
+class HyperLogLog:
+    """Fixed-size distinct count estimator that can be merged and cached as a string"""
+
+    def __init__(self, precision=DEFAULT_PRECISION, registers=None):
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = registers if registers is not None else bytearray(self.m)
+
+    def add(self, value):
+        digest = hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest()
+        h = int.from_bytes(digest, "big")
+        width = 64 - self.precision
+        index = h >> width
+        rank = width - (h & ((1 << width) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other):
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches with different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def count(self):
+        alpha = 0.7213 / (1 + 1.079 / self.m)
+        estimate = alpha * self.m**2 / sum(2.0**-r for r in self.registers)
+        zeros = self.registers.count(0)
+        # Linear counting is more accurate for small cardinalities
+        if estimate <= 2.5 * self.m and zeros:
+            estimate = self.m * math.log(self.m / zeros)
+        return round(estimate)
+
+    def to_string(self):
+        """Serialize for the JSON cache, storing only non-empty registers when sparse"""
+        filled = [(i, r) for i, r in enumerate(self.registers) if r]
+        if len(filled) * 3 < self.m:
+            payload = b"".join(i.to_bytes(2, "big") + bytes([r]) for i, r in filled)
+            kind = "s"
+        else:
+            payload = bytes(self.registers)
+            kind = "d"
+        return f"{self.precision}:{kind}:{base64.b64encode(payload).decode('ascii')}"
+
+    @classmethod
+    def from_string(cls, data):
+        precision, kind, encoded = data.split(":")
+        precision = int(precision)
+        m = 1 << precision
+        payload = base64.b64decode(encoded)
+        if kind == "d":
+            if len(payload) != m:
+                raise ValueError(
+                    f"Dense sketch has {len(payload)} registers, expected {m}"
+                )
+            return cls(precision, bytearray(payload))
+
+        if len(payload) % 3:
+            raise ValueError("Sparse sketch payload is truncated")
+        registers = bytearray(m)
+        for pos in range(0, len(payload), 3):
+            index = int.from_bytes(payload[pos : pos + 2], "big")
+            registers[index] = payload[pos + 2]
+        return cls(precision, registers)
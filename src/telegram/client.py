@@ -4,10 +4,20 @@ from datetime import datetime
 import asyncio
 from tqdm import tqdm
 from src.telegram.utils import mask_channel_link, clean_text
+from src.sketch import HyperLogLog
+from src.registry import (
+    get_channel_registry,
+    message_fingerprint,
+    is_processed,
+    mark_processed,
+)
 from collections import Counter
 
 logger = logging.getLogger(__name__)
 
+# Number of already registered messages re-read each run to pick up edits
+EDIT_RECHECK_WINDOW = 100
+
 
 async def get_messages_by_hour(client, chat, topic_id, topic_title, timezone):
     messages_by_hour = {}
@@ -31,12 +41,19 @@ async def get_messages_by_hour(client, chat, topic_id, topic_title, timezone):
                 "first_id": message.id,
                 "last_id": message.id,
                 "hour": hour,
+                "senders": HyperLogLog(),
             }
         current = messages_by_hour[hour_str]
         current["count"] += 1
+        if message.sender_id is not None:
+            current["senders"].add(message.sender_id)
         current["last_id"] = max(current["last_id"], message.id)
         current["first_id"] = min(current["first_id"], message.id)
 
+    # Sketches are cached as strings next to each hourly bucket
+    for current in messages_by_hour.values():
+        current["senders_sketch"] = current.pop("senders").to_string()
+
     logger.info(f"Completed topic '{topic_title}' with {total_messages} messages")
     return messages_by_hour
 
@@ -90,7 +107,7 @@ async def get_chat_stats(client, chat_id, timezone):
             return None
 
 
-async def get_channel_stats(client, channel_id, timezone):
+async def get_channel_stats(client, channel_id, timezone, registry):
     max_retries = 3
     for retry in range(max_retries):
         try:
@@ -107,11 +124,25 @@ async def get_channel_stats(client, channel_id, timezone):
             participants = await client.get_participants(channel, limit=0)
             stats["member_count"] = participants.total
 
+            channel_registry = get_channel_registry(registry, str(channel.id))
             messages = []
             hashtag_occurrences = []
-
-            async for message in client.iter_messages(channel, limit=100):
+            processed = []
+            known_seen = 0
+
+            # Newest first: everything above the stored max id is new, then a
+            # window of known messages is re-read to catch edits
+            async for message in client.iter_messages(channel):
+                if message.id <= channel_registry["max_id"]:
+                    known_seen += 1
+                    if known_seen > EDIT_RECHECK_WINDOW:
+                        break
                 if message.text:
+                    fingerprint = message_fingerprint(message)
+                    if is_processed(channel_registry, message, fingerprint):
+                        continue
+                    processed.append((message, fingerprint))
+
                     # Extract hashtags from the text
                     message_hashtags = [
                         word for word in message.text.split() if word.startswith("#")
@@ -137,8 +168,15 @@ async def get_channel_stats(client, channel_id, timezone):
                             }
                         )
 
+            # Register only after a complete pass so a retry does not skip messages
+            mark_processed(channel_registry, processed, EDIT_RECHECK_WINDOW)
+
+            logger.info(
+                f"Channel '{channel.title}': {len(messages)} new or edited messages"
+            )
             stats["messages"] = messages
             stats["hashtag_occurrences"] = hashtag_occurrences
+            stats["message_count"] = channel_registry["message_count"]
 
             return stats
 